@@ -1,6 +1,10 @@
+import sys
+
 # Constants for the Dial Lock
 DIAL_SIZE = 100
 START_POSITION = 50
+# Bytes read at a time by the streaming solver
+CHUNK_SIZE = 1 << 20
 
 def get_rotations():
     """Reads rotations from input.txt or raises an error if not found."""
@@ -34,32 +38,32 @@ def part1():
             zero_count += 1
     return zero_count
 
+def calculate_zero_clicks(start_pos, direction, distance):
+    """
+    Calculates the total number of times the dial hits 0 during the rotation.
+    The dial position is 0-99.
+    """
+    if distance <= 0:
+        return 0
+    if start_pos == 0:
+        return distance // DIAL_SIZE
+    if direction == 'L':
+        distance_to_first_zero = start_pos
+    elif direction == 'R':
+        distance_to_first_zero = DIAL_SIZE - start_pos
+    if distance < distance_to_first_zero:
+        return 0 
+    zero_count = 1
+    remaining_distance = distance - distance_to_first_zero
+    zero_count += remaining_distance // DIAL_SIZE
+    return zero_count
+
 def part2():
     """
     Solves Part 2: Counts the number of times any click causes the dial to point at 0,
     regardless of whether it happens during a rotation or at the end of one.
     This logic requires counting the passes through 0.
     """
-    def calculate_zero_clicks(start_pos, direction, distance):
-        """
-        Calculates the total number of times the dial hits 0 during the rotation.
-        The dial position is 0-99.
-        """
-        if distance <= 0:
-            return 0
-        if start_pos == 0:
-            return distance // DIAL_SIZE
-        if direction == 'L':
-            distance_to_first_zero = start_pos
-        elif direction == 'R':
-            distance_to_first_zero = DIAL_SIZE - start_pos
-        if distance < distance_to_first_zero:
-            return 0 
-        zero_count = 1
-        remaining_distance = distance - distance_to_first_zero
-        zero_count += remaining_distance // DIAL_SIZE
-        return zero_count
-
     rotations = get_rotations()
     current_position = START_POSITION
     total_zero_count = 0
@@ -76,7 +80,103 @@ def part2():
             current_position = (current_position - distance) % DIAL_SIZE
     return total_zero_count
 
+def parse_rotations_array(lines):
+    """
+    Parses all rotations at once into a signed int64 NumPy array:
+    'R50' becomes 50 and 'L101' becomes -101.
+    """
+    import numpy as np
+    text = "".join(lines).translate({ord("R"): None, ord("L"): "-"})
+    return np.fromstring(text, dtype=np.int64, sep=" ")
+
+def simulate_dials(deltas, start_positions=START_POSITION, dial_sizes=DIAL_SIZE):
+    """
+    Vectorized version of part1 and part2 for one or many dials at once.
+    'start_positions' and 'dial_sizes' may be scalars or arrays; they are broadcast
+    against each other and every resulting dial replays the same signed rotations.
+    Returns two arrays with the Part 1 and Part 2 zero counts of each dial.
+    """
+    import numpy as np
+    starts, sizes = np.broadcast_arrays(
+        np.asarray(start_positions, dtype=np.int64), np.asarray(dial_sizes, dtype=np.int64)
+    )
+    starts = starts.reshape(-1, 1)
+    sizes = sizes.reshape(-1, 1)
+    deltas = np.asarray(deltas, dtype=np.int64).reshape(1, -1)
+    # Position after every rotation, and the position each rotation starts from
+    positions = (starts + np.cumsum(deltas, axis=1)) % sizes
+    before = (positions - deltas) % sizes
+    # Same counting as calculate_zero_clicks: a left turn is a right turn on the mirrored dial
+    distance_to_zero = np.where(deltas >= 0, before, (sizes - before) % sizes)
+    zero_clicks = (distance_to_zero + np.abs(deltas)) // sizes
+    shape = np.broadcast(start_positions, dial_sizes).shape
+    part1_counts = np.count_nonzero(positions == 0, axis=1).reshape(shape)
+    part2_counts = zero_clicks.sum(axis=1).reshape(shape)
+    return part1_counts, part2_counts
+
+def solve_numpy(start_positions=START_POSITION, dial_sizes=DIAL_SIZE):
+    """
+    Solves both parts with the NumPy dial simulator, reading input.txt only once.
+    """
+    deltas = parse_rotations_array(get_rotations())
+    return simulate_dials(deltas, start_positions, dial_sizes)
+
+def iter_rotation_records(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yields rotation records (e.g. b'R50') from a binary stream, reading it in chunks.
+    A record cut in half at the end of a chunk is kept until the next chunk completes it,
+    so memory use stays bounded by the chunk size.
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (pending + chunk).split()
+        pending = records.pop() if records and not chunk[-1:].isspace() else b""
+        yield from records
+    if pending:
+        yield pending
+
+def solve_streaming(source="input.txt", chunk_size=CHUNK_SIZE):
+    """
+    Solves both parts in a single pass with constant memory.
+    'source' is a file name, '-' for stdin, or an already opened binary stream (e.g. a pipe).
+    Returns the Part 1 and Part 2 zero counts.
+    """
+    if source == "-":
+        return solve_streaming(sys.stdin.buffer, chunk_size)
+    if isinstance(source, str):
+        try:
+            with open(source, "rb") as f:
+                return solve_streaming(f, chunk_size)
+        except FileNotFoundError:
+            print(f"Error: '{source}' not found. Ensure the file is present.")
+            raise
+    current_position = START_POSITION
+    zero_count = 0
+    total_zero_count = 0
+    for record in iter_rotation_records(source, chunk_size):
+        direction = "R" if record[:1] == b"R" else "L"
+        distance = int(record[1:])
+        total_zero_count += calculate_zero_clicks(current_position, direction, distance)
+        if direction == "R":
+            current_position = (current_position + distance) % DIAL_SIZE
+        else:
+            current_position = (current_position - distance) % DIAL_SIZE
+        if current_position == 0:
+            zero_count += 1
+    return zero_count, total_zero_count
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Stream a rotation log given by name, or '-' for stdin
+        password_part1, password_part2 = solve_streaming(sys.argv[1])
+        print(f"--- Part 1: Final Position Zero Count ---")
+        print(f"The password is: {password_part1}")
+        print(f"\n--- Part 2: Zero Pass-Through Click Count ---")
+        print(f"The password is: {password_part2}")
+        sys.exit()
     # Solve Part 1
     password_part1 = part1()
     print(f"--- Part 1: Final Position Zero Count ---")
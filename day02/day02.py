@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 MAX_DIGITS = 10 
 MIN_DIGITS = 2
 def read_data(filename="input.txt"):
@@ -19,45 +21,118 @@ def read_data(filename="input.txt"):
         parsed_ranges.append((lower_bound, upper_bound))
     return parsed_ranges
 
-def part1(ranges: list[tuple[int, int]]) -> int:
+def build_range_index(ranges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """
+    Sorts the ranges and merges overlapping or touching ones into a searchable index.
+    Returns parallel lists (starts, ends), so every ID is covered by at most one range
+    and the ranges around an ID span can be found with bisect.
+    """
+    starts = []
+    ends = []
+    for lower, upper in sorted(ranges):
+        if ends and lower <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], upper)
+        else:
+            starts.append(lower)
+            ends.append(upper)
+    return starts, ends
+
+def digit_count(n: int) -> int:
+    """Returns the number of decimal digits of n without converting it to a string."""
+    digits = 1
+    while n >= 10**digits:
+        digits += 1
+    return digits
+
+def repeat_multiplier(L: int, R: int) -> int:
+    """
+    Returns the multiplier that repeats an L-digit block K exactly R times:
+    1 + 10^L + 10^(2L) + ... + 10^((R-1)L).
+    """
+    return (10**(L * R) - 1) // (10**L - 1)
+
+def sum_repeated_ids(L: int, R: int, index: tuple[list[int], list[int]]) -> int:
+    """
+    Sums all IDs K * multiplier (K with exactly L digits) that fall inside the indexed ranges.
+    Only ranges overlapping [min_k * multiplier, max_k * multiplier] are visited (found with bisect);
+    for each of them the valid K values form one interval, summed as an arithmetic series.
+    """
+    starts, ends = index
+    multiplier = repeat_multiplier(L, R)
+    min_k = 10**(L - 1)
+    max_k = 10**L - 1
+    first = bisect_left(ends, min_k * multiplier)
+    last = bisect_right(starts, max_k * multiplier)
+    total = 0
+    for lower, upper in zip(starts[first:last], ends[first:last]):
+        first_k = max(min_k, -(-lower // multiplier))
+        last_k = min(max_k, upper // multiplier)
+        if first_k <= last_k:
+            total += multiplier * (first_k + last_k) * (last_k - first_k + 1) // 2
+    return total
+
+def mobius(n: int) -> int:
+    """Returns the Mobius function mu(n)."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+def sum_periodic_ids(digits: int, index: tuple[list[int], list[int]]) -> int:
+    """
+    Sums all IDs with exactly 'digits' digits that are some block repeated R >= 2 times.
+    An ID with period p is also periodic for every multiple of p, so the repetition counts
+    overlap. Inclusion-exclusion over primitive periods counts each ID once:
+    sum = -sum(mu(digits / p) * S(p)) over proper divisors p, where S(p) sums the IDs with period p.
+    """
+    total = 0
+    for period in range(1, digits):
+        if digits % period == 0:
+            coefficient = -mobius(digits // period)
+            if coefficient:
+                total += coefficient * sum_repeated_ids(period, digits // period, index)
+    return total
+
+def resolve_max_digits(index: tuple[list[int], list[int]], max_digits: int | None) -> int:
+    """Returns max_digits, or the digit count of the largest indexed ID when it is None."""
+    if max_digits is not None:
+        return max_digits
+    _, ends = index
+    return digit_count(ends[-1]) if ends else MIN_DIGITS
+
+def part1(ranges: list[tuple[int, int]], max_digits: int | None = MAX_DIGITS) -> int:
     """
     Solves Part 1: Finds and sums all invalid IDs (K repeated exactly 2 times, e.g., KK).
     Formula: ID = K * (10^L + 1), where L is the number of digits in K.
-    The maximum ID length is 10 digits, so L ranges from 1 to 5.
+    IDs have at most 'max_digits' digits (derived from the ranges when None), so L ranges
+    from 1 to max_digits // 2.
     """
+    index = build_range_index(ranges)
+    max_digits = resolve_max_digits(index, max_digits)
     total_sum_of_invalid_ids = 0
-    for L in range(MIN_DIGITS // 2, MAX_DIGITS // 2 + 1): 
-        multiplier = 10**L + 1
-        min_k = 10**(L - 1)
-        max_k = 10**L - 1
-        for K in range(min_k, max_k + 1):
-            invalid_id = K * multiplier
-            for lower, upper in ranges:
-                if lower <= invalid_id <= upper:
-                    total_sum_of_invalid_ids += invalid_id
-                    break
+    for L in range(MIN_DIGITS // 2, max_digits // 2 + 1):
+        total_sum_of_invalid_ids += sum_repeated_ids(L, 2, index)
     return total_sum_of_invalid_ids
 
-def part2(ranges: list[tuple[int, int]]) -> int:
+def part2(ranges: list[tuple[int, int]], max_digits: int | None = MAX_DIGITS) -> int:
     """
     Solves Part 2: Finds and sums all invalid IDs (K repeated R >= 2 times, e.g., KKK, KKKK).
-    We use a set to ensure each unique invalid ID is counted only once.
+    IDs reachable from several (L, R) pairs are counted only once.
+    IDs have at most 'max_digits' digits (derived from the ranges when None).
     """
-    found_invalid_ids = set()
-    for L in range(MIN_DIGITS // 2, MAX_DIGITS // 2 + 1):
-        min_k = 10**(L - 1)
-        max_k = 10**L - 1
-        for R in range(2, MAX_DIGITS // L + 1):
-            multiplier = sum(10**(L * i) for i in range(R))
-            for K in range(min_k, max_k + 1):
-                invalid_id = K * multiplier
-                if len(str(invalid_id)) > MAX_DIGITS:
-                    continue 
-                for lower, upper in ranges:
-                    if lower <= invalid_id <= upper:
-                        found_invalid_ids.add(invalid_id)
-                        break
-    total_sum_of_invalid_ids = sum(found_invalid_ids)
+    index = build_range_index(ranges)
+    max_digits = resolve_max_digits(index, max_digits)
+    total_sum_of_invalid_ids = 0
+    for digits in range(MIN_DIGITS, max_digits + 1):
+        total_sum_of_invalid_ids += sum_periodic_ids(digits, index)
     return total_sum_of_invalid_ids
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+import os
+
+
 def read_batteries_banks(filename: str = "input.txt") -> list[str]:
     """
     Reads all lines from the given input file and returns a list of stripped lines.
@@ -50,6 +53,108 @@ def part2(lines: list[str], required_length: int = 12) -> int:
     return total
 
 
+class BankMaxIndex:
+    """
+    Sparse-table range-max index over one battery bank, built once in O(n log n).
+    Answers "best k-digit subsequence" for any k with k range-max queries, working
+    directly on the bank bytes.
+    """
+
+    def __init__(self, bank: bytes):
+        self.bank = bank
+        # table[j][i] is the leftmost position of the largest digit in bank[i:i + 2**j]
+        self.table = [list(range(len(bank)))]
+        span = 1
+        while 2 * span <= len(bank):
+            prev = self.table[-1]
+            level = []
+            for i in range(len(bank) - 2 * span + 1):
+                left, right = prev[i], prev[i + span]
+                level.append(right if bank[right] > bank[left] else left)
+            self.table.append(level)
+            span *= 2
+
+    def argmax(self, lo: int, hi: int) -> int:
+        """Returns the leftmost position of the largest digit in bank[lo:hi + 1]."""
+        j = (hi - lo + 1).bit_length() - 1
+        left, right = self.table[j][lo], self.table[j][hi - (1 << j) + 1]
+        return right if self.bank[right] > self.bank[left] else left
+
+    def best(self, k: int) -> int:
+        """
+        Returns the largest number formed by keeping k digits of the bank in order
+        (the whole bank when it has fewer than k digits).
+        Each digit is the largest one that still leaves room for the remaining digits.
+        """
+        n = len(self.bank)
+        k = min(k, n)
+        value = 0
+        pos = 0
+        for remaining in range(k, 0, -1):
+            pos = self.argmax(pos, n - remaining)
+            value = value * 10 + self.bank[pos] - ord("0")
+            pos += 1
+        return value
+
+def joltage_totals(lines: list[str], lengths=range(2, 21)) -> dict[int, int]:
+    """
+    For every required length k, sums the best k-digit joltage over all banks.
+    Each bank is indexed once and the index is reused for all lengths.
+    """
+    totals = {k: 0 for k in lengths}
+    for line in lines:
+        if not line:
+            continue
+        index = BankMaxIndex(line.encode())
+        for k in totals:
+            totals[k] += index.best(k)
+    return totals
+
+def read_batteries_banks_array(filename: str = "input.txt") -> dict:
+    """
+    Memory-maps the input file and returns the battery banks grouped by length,
+    as a dict {length: 2-D uint8 NumPy array of digits, one row per bank}.
+    No per-line string objects are created.
+    """
+    import numpy as np
+    try:
+        if os.path.getsize(filename) == 0:
+            return {}
+        raw = np.memmap(filename, dtype=np.uint8, mode="r")
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found. Ensure the file exists.")
+        raise
+    # Banks are the maximal runs of digit characters
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    banks = {}
+    for length in np.unique(lengths):
+        group_starts = starts[lengths == length]
+        banks[int(length)] = raw[group_starts[:, None] + np.arange(length)] - ord("0")
+    return banks
+
+def part1_batched(banks: dict) -> int:
+    """
+    Vectorized Part 1 over banks grouped by length (see read_batteries_banks_array).
+    Per row, the first digit is the argmax over all but the last battery, and the second digit
+    is the suffix maximum right after it.
+    """
+    import numpy as np
+    total = 0
+    for length, digits in banks.items():
+        if length < 2:
+            continue
+        rows = np.arange(len(digits))
+        first_pos = np.argmax(digits[:, :-1], axis=1)
+        suffix_max = np.maximum.accumulate(digits[:, ::-1], axis=1)[:, ::-1]
+        first_digit = digits[rows, first_pos].astype(np.int64)
+        second_digit = suffix_max[rows, first_pos + 1]
+        total += int((first_digit * 10 + second_digit).sum())
+    return total
+
+
 if __name__ == "__main__":
     data = read_batteries_banks()
     # Part 1
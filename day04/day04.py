@@ -74,6 +74,93 @@ def part2() -> int:
     return removed
 
 
+def peel_rolls(grid: list[list[str]]) -> list[int]:
+    """
+    Incremental version of the Part 2 removal process (k-core style peeling).
+    Keeps the neighbour count of every roll and only revisits rolls whose count
+    dropped below four, so the total work is proportional to cells plus removals.
+    Returns the number of rolls removed in each round.
+    """
+    height = len(grid)
+    width = max((len(row) for row in grid), default=0)
+    present = [False] * (height * width)
+    for r, row in enumerate(grid):
+        for c, val in enumerate(row):
+            present[r * width + c] = val == "@"
+
+    def neighbors(cell):
+        r, c = divmod(cell, width)
+        for nr in range(max(r - 1, 0), min(r + 2, height)):
+            for nc in range(max(c - 1, 0), min(c + 2, width)):
+                if nr != r or nc != c:
+                    yield nr * width + nc
+
+    counts = [0] * (height * width)
+    for cell, is_roll in enumerate(present):
+        if is_roll:
+            counts[cell] = sum(present[n] for n in neighbors(cell))
+    current = [cell for cell, is_roll in enumerate(present) if is_roll and counts[cell] < 4]
+    for cell in current:
+        present[cell] = False
+    removed_per_round = []
+    while current:
+        removed_per_round.append(len(current))
+        next_round = []
+        for cell in current:
+            for n in neighbors(cell):
+                counts[n] -= 1
+                if present[n] and counts[n] == 3:
+                    present[n] = False
+                    next_round.append(n)
+        current = next_round
+    return removed_per_round
+
+def part2_incremental(filename: str = "input.txt") -> int:
+    """
+    Worklist-based Part 2: total number of rolls the forklifts can remove.
+    """
+    return sum(peel_rolls(read_input(filename)))
+
+def read_input_array(filename: str = "input.txt"):
+    """
+    Load the grid of paper rolls as a 2-D boolean NumPy array (True where '@').
+    """
+    import numpy as np
+    try:
+        with open(filename, "rb") as f:
+            rows = [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found. Ensure the file exists.")
+        raise
+    if not rows:
+        return np.zeros((0, 0), dtype=bool)
+    cells = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)
+    return cells == ord("@")
+
+def count_neighbors(rolls):
+    """
+    Count the rolls in the 8 adjacent cells of every cell at once:
+    the grid is zero-padded and the 8 shifted 3x3 windows are added together.
+    """
+    import numpy as np
+    height, width = rolls.shape
+    padded = np.pad(rolls.astype(np.uint8), 1)
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dr in range(3):
+        for dc in range(3):
+            if dr != 1 or dc != 1:
+                counts += padded[dr:dr + height, dc:dc + width]
+    return counts
+
+def part1_numpy(filename: str = "input.txt") -> int:
+    """
+    Vectorized Part 1: a roll is accessible if fewer than four adjacent cells contain '@'.
+    """
+    import numpy as np
+    rolls = read_input_array(filename)
+    return int(np.count_nonzero(rolls & (count_neighbors(rolls) < 4)))
+
+
 if __name__ == "__main__":
     # Part 1
     result1 = part1()
@@ -1,3 +1,14 @@
+import sys
+from bisect import bisect_right
+from contextlib import nullcontext
+from itertools import chain, islice
+
+# Number of ingredient IDs classified per batch in streaming mode
+ID_CHUNK_SIZE = 65536
+# Largest value the NumPy batch path can hold
+INT64_MAX = 2**63 - 1
+
+
 def load_inventory_data(filename: str = "input.txt"):
     """
     Read the database file and return a list of fresh-ID ranges
@@ -21,45 +32,134 @@ def load_inventory_data(filename: str = "input.txt"):
         print(f"Error: File '{filename}' not found. Ensure the file exists.")
         raise
 
-def part1() -> int:
+class FreshRangeIndex:
+    """
+    Merged, sorted fresh-ID ranges stored as parallel start/end lists.
+    Membership is answered with bisect, or with numpy.searchsorted for whole ID batches.
+    """
+
+    def __init__(self, ranges):
+        self.starts = []
+        self.ends = []
+        for start, end in sorted(ranges):
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __contains__(self, food_id: int) -> bool:
+        pos = bisect_right(self.starts, food_id) - 1
+        return pos >= 0 and food_id <= self.ends[pos]
+
+    def contains_many(self, food_ids):
+        """Returns a boolean NumPy array telling which of the IDs are fresh."""
+        import numpy as np
+        food_ids = np.asarray(food_ids, dtype=np.int64)
+        if not self.starts:
+            return np.zeros(food_ids.shape, dtype=bool)
+        starts = np.asarray(self.starts, dtype=np.int64)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        pos = np.searchsorted(starts, food_ids, side="right") - 1
+        return (pos >= 0) & (food_ids <= ends[np.maximum(pos, 0)])
+
+    def count_fresh(self, food_ids) -> int:
+        """Counts how many of the IDs fall within any fresh range."""
+        return sum(1 for food_id in food_ids if food_id in self)
+
+    def total_size(self) -> int:
+        """Returns the number of IDs covered by the merged ranges."""
+        return sum(end - start + 1 for start, end in zip(self.starts, self.ends))
+
+def part1(index: FreshRangeIndex | None = None, food_ids: list[int] | None = None) -> int:
     """
     Count how many available ingredient IDs fall within
     any of the fresh-ID ranges.
     """
-    ranges, food_ids = load_inventory_data()
-    counter = 0
-    for food_id in food_ids:
-        for r in ranges:
-            if r[0] <= food_id <= r[1]:
-                counter += 1
-                break
-    return counter
-
-def part2() -> int:
+    if index is None or food_ids is None:
+        ranges, loaded_ids = load_inventory_data()
+        if index is None:
+            index = FreshRangeIndex(ranges)
+        if food_ids is None:
+            food_ids = loaded_ids
+    return index.count_fresh(food_ids)
+
+def part2(index: FreshRangeIndex | None = None) -> int:
     """
     Merge all overlapping fresh-ID ranges and return the total
     number of IDs covered by the merged ranges.
     """
-    ranges, _ = load_inventory_data()
-    ranges.sort(key=lambda x: x[0])
-    merged = []
-    current_start, current_end = ranges[0]
-    for start, end in ranges[1:]:
-        if start <= current_end + 1:
-            current_end = max(current_end, end)
+    if index is None:
+        ranges, _ = load_inventory_data()
+        index = FreshRangeIndex(ranges)
+    return index.total_size()
+
+def open_source(source: str):
+    """Opens a file for reading, or stdin (left open afterwards) when source is '-'."""
+    if source == "-":
+        return nullcontext(sys.stdin)
+    try:
+        return open(source, "r")
+    except FileNotFoundError:
+        print(f"Error: File '{source}' not found. Ensure the file exists.")
+        raise
+
+def read_fresh_index(lines) -> tuple[FreshRangeIndex, list[str]]:
+    """
+    Phase one of streaming mode: consumes range lines until the first line that is
+    not a range (the blank separator) and merges them into a FreshRangeIndex.
+    Returns the index and the consumed non-range line (as a list, possibly empty).
+    """
+    ranges = []
+    for line in lines:
+        if "-" not in line:
+            return FreshRangeIndex(ranges), [line]
+        start, end = line.strip().split("-")
+        ranges.append((int(start), int(end)))
+    return FreshRangeIndex(ranges), []
+
+def stream_fresh_counts(index: FreshRangeIndex, lines, chunk_size: int = ID_CHUNK_SIZE):
+    """
+    Phase two of streaming mode: classifies ingredient IDs chunk by chunk (with
+    numpy.searchsorted, or bisect for IDs beyond int64) and yields
+    (checked, fresh) counts per chunk, never keeping more than one chunk of IDs in memory.
+    """
+    lines = iter(lines)
+    while True:
+        chunk = [int(line) for line in islice(lines, chunk_size) if line.strip().isdigit()]
+        if not chunk:
+            # islice may return only blank lines, so check the input is really exhausted
+            line = next(lines, None)
+            if line is None:
+                return
+            lines = chain([line], lines)
+            continue
+        if max(chunk) <= INT64_MAX and (not index.ends or index.ends[-1] <= INT64_MAX):
+            fresh = int(index.contains_many(chunk).sum())
         else:
-            merged.append([current_start, current_end])
-            current_start, current_end = start, end
-    merged.append([current_start, current_end])
-    total = sum(end - start + 1 for start, end in merged)
-    return total
+            fresh = index.count_fresh(chunk)
+        yield len(chunk), fresh
+
+def part1_streaming(filename: str = "input.txt", ids_source: str | None = None) -> int:
+    """
+    Streaming Part 1: merges the range section of 'filename' first, then streams the
+    ingredient IDs that follow it, or the IDs from 'ids_source' ('-' for stdin) if given.
+    """
+    with open_source(filename) as f:
+        index, leftover = read_fresh_index(f)
+        if ids_source is None:
+            return sum(fresh for _, fresh in stream_fresh_counts(index, chain(leftover, f)))
+    with open_source(ids_source) as ids:
+        return sum(fresh for _, fresh in stream_fresh_counts(index, ids))
 
 if __name__ == "__main__":
+    ranges, food_ids = load_inventory_data()
+    index = FreshRangeIndex(ranges)
     # Part 1
-    result1 = part1()
+    result1 = part1(index, food_ids)
     print("--- Part 1 ---")
     print(f"Quantity of fresh products available in stock: {result1}")
     # Part 2
-    result2 = part2()
+    result2 = part2(index)
     print("\n--- Part 2 ---")
     print(f"The number of all possible different fresh products in the database: {result2}")
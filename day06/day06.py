@@ -1,3 +1,6 @@
+import sys
+
+
 def part1() -> int:
     """
     Apply the operations column-wise across all rows of numbers:
@@ -85,6 +88,125 @@ def part2(filename: str = "input.txt") -> int:
     return total
 
 
+def read_last_line(f, block_size: int = 4096) -> bytes:
+    """
+    Return the last non-empty line of a seekable binary file by reading backwards
+    from its end, without reading the rest of the file.
+    The tail read from the end doubles each step, so the total I/O stays linear
+    in the length of the line.
+    """
+    end = f.seek(0, 2)
+    tail = b""
+    position = end
+    while position > 0:
+        position = max(0, position - block_size)
+        block_size *= 2
+        f.seek(position)
+        tail = f.read(end - position)
+        stripped = tail.rstrip()
+        if b"\n" in stripped:
+            return stripped.rsplit(b"\n", 1)[1]
+    return tail.strip()
+
+def part1_streaming(filename: str = "input.txt") -> int:
+    """
+    Streaming version of part1 with memory proportional to the number of columns.
+    The file is read row by row ('-' reads stdin). When the file is seekable, the operator
+    row is read first from the end of the file, so each column keeps a single running value.
+    Otherwise running sums and products are kept side by side until the operator row arrives.
+    """
+    if filename == "-":
+        return part1_stream_rows(sys.stdin.buffer, None)
+    try:
+        with open(filename, "rb") as f:
+            operations = read_last_line(f).split()
+            f.seek(0)
+            return part1_stream_rows(f, operations)
+    except FileNotFoundError:
+        print(f"Error: '{filename}' not found. Ensure the file is present.")
+        raise
+
+def part1_stream_rows(rows, operations: list[bytes] | None) -> int:
+    """
+    Fold the number rows of a binary stream column-wise into running sums and products.
+    'operations' may be None when the operator row is not known in advance;
+    in that case it is taken from the stream itself.
+    """
+    sums = []
+    products = []
+    for line in rows:
+        tokens = line.split()
+        if not tokens:
+            continue
+        if not tokens[0].isdigit():
+            operations = tokens
+            continue
+        values = [int(token) for token in tokens]
+        if not sums:
+            sums, products = values, values.copy()
+            continue
+        for i, value in enumerate(values):
+            if operations is None or operations[i] == b"+":
+                sums[i] += value
+            if operations is None or operations[i] == b"*":
+                products[i] *= value
+    return sum(sums[i] if op == b"+" else products[i] for i, op in enumerate(operations))
+
+def read_worksheet_array(filename: str = "input.txt"):
+    """
+    Read the worksheet as a 2-D uint8 NumPy array of characters,
+    with short lines padded by spaces on the right.
+    """
+    import numpy as np
+    try:
+        with open(filename, "rb") as f:
+            raw = [line.rstrip(b"\r\n") for line in f]
+    except FileNotFoundError:
+        print(f"Error: '{filename}' not found. Ensure the file is present.")
+        raise
+    width = max(len(line) for line in raw)
+    data = b"".join(line.ljust(width) for line in raw)
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(raw), width)
+
+def part2_numpy(filename: str = "input.txt") -> int:
+    """
+    Vectorized version of part2:
+    - gap columns are found with one reduction over the whole worksheet,
+    - column numbers are assembled as dot products of digits and powers of ten,
+    - every block is summed or multiplied with one reduceat call,
+      in int64 when that cannot overflow and in Python ints otherwise.
+    """
+    import numpy as np
+    grid = read_worksheet_array(filename)
+    digits_area, ops_row = grid[:-1], grid[-1]
+    # Separate continuous column blocks (problems)
+    used = (grid != ord(" ")).any(axis=0)
+    edges = np.diff(used.astype(np.int8), prepend=0, append=0)
+    block_starts = np.flatnonzero(edges == 1)
+    block_ends = np.flatnonzero(edges == -1)
+    if len(block_starts) == 0:
+        return 0
+    # Number in each column: digits read top to bottom, spaces skipped
+    is_digit = (digits_area >= ord("0")) & (digits_area <= ord("9"))
+    # int64 is used only while no block sum can overflow it; otherwise Python ints
+    exact = 10 ** len(digits_area) * int((block_ends - block_starts).max()) <= np.iinfo(np.int64).max
+    dtype = np.int64 if exact else object
+    digit_values = np.where(is_digit, digits_area - ord("0"), 0).astype(dtype)
+    digits_below = np.cumsum(is_digit[::-1], axis=0)[::-1] - is_digit
+    numbers = (digit_values * 10 ** digits_below.astype(dtype)).sum(axis=0)
+    has_number = is_digit.any(axis=0)
+    # Operator of each block: the first '+' or '*' inside it (multiplication otherwise)
+    # A trailing blank sentinel column guarantees every search lands on a valid column
+    ops_row = np.append(ops_row, ord(" "))
+    op_positions = np.append(np.flatnonzero((ops_row == ord("+")) | (ops_row == ord("*"))), len(ops_row) - 1)
+    op_columns = op_positions[np.searchsorted(op_positions, block_starts)]
+    is_sum = (op_columns < block_ends) & (ops_row[op_columns] == ord("+"))
+    # Compute the result of every problem
+    sums = np.add.reduceat(np.where(has_number, numbers, 0), block_starts)
+    products = np.multiply.reduceat(np.where(has_number, numbers, 1).astype(object), block_starts)
+    return sum(sums[is_sum].tolist()) + sum(products[~is_sum])
+
+
 if __name__ == "__main__":
     print("--- Part 1 ---")
     print(f"Cephalopod math homework version 1: {part1()}")
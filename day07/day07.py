@@ -60,12 +60,88 @@ def part2():
     
     return dfs(start[0] + 1, start[1])
 
+def row_mask(row, chars):
+    """Returns a bitmask with bit i set when row[i] is one of 'chars'."""
+    table = {ord(ch): "0" for ch in set(row)}
+    table.update({ord(ch): "1" for ch in chars})
+    return int(row[::-1].translate(table) or "0", 2)
+
+def propagate_beams(grid):
+    """
+    Bitset version of the part1 simulation: every row's beams and splitters are
+    big-int bitmasks (bit i is column i), so each row costs a few AND/OR/shift operations.
+    Assumes no two splitters are adjacent (part1 lets the first of them overwrite the second).
+    Returns the number of splits and the beam bitmask of every row.
+    """
+    full = (1 << len(grid[0])) - 1
+    beams = row_mask(grid[0], "S")
+    beam_rows = [beams]
+    splits = 0
+    for row in grid[1:]:
+        hits = beams & row_mask(row, "^")
+        splits += hits.bit_count()
+        beams = (beams & row_mask(row, ".")) | (((hits << 1) | (hits >> 1)) & full)
+        beam_rows.append(beams)
+    return splits, beam_rows
+
+def render_beams(grid, beam_rows):
+    """Lazily yields the rendered rows, drawing '|' wherever a beam passes."""
+    yield grid[0]
+    for row, beams in zip(grid[1:], beam_rows[1:]):
+        yield "".join("|" if beams >> i & 1 else ch for i, ch in enumerate(row))
+
+def part1_bitset(render=False):
+    """
+    Simulates classical tachyon beam splitting with row bitmasks.
+    The rendered schema is only built when 'render' is True.
+    """
+    grid = [line.rstrip("\n") for line in read_schema()]
+    result, beam_rows = propagate_beams(grid)
+    new_text = "\n".join(render_beams(grid, beam_rows)) if render else None
+    return result, new_text
+
+def count_timelines(grid):
+    """
+    Iterative row-by-row version of the part2 DFS using O(width) memory.
+    Keeps how many timelines reach each column and moves them down one row at a time;
+    a splitter sends its count to the columns on both sides.
+    Returns the total number of timelines and the timeline count after each row.
+    """
+    width = len(grid[0])
+    start_row, start_col = next(
+        (r, row.index("S")) for r, row in enumerate(grid) if "S" in row
+    )
+    counts = [0] * width
+    counts[start_col] = 1
+    per_row = []
+    for row in grid[start_row + 1:]:
+        new_counts = [0] * width
+        for c, count in enumerate(counts):
+            if not count:
+                continue
+            if row[c] == "^":
+                if c > 0:
+                    new_counts[c - 1] += count
+                if c < width - 1:
+                    new_counts[c + 1] += count
+            else:
+                new_counts[c] += count
+        counts = new_counts
+        per_row.append(sum(counts))
+    return sum(counts), per_row
+
+def part2_iterative():
+    """Counts the number of possible quantum timelines without recursion"""
+    grid = [line.rstrip("\n") for line in read_schema()]
+    total, _ = count_timelines(grid)
+    return total
+
 if __name__ == "__main__":
     # Solve Part 1
-    password_part1, _ = part1()
+    password_part1, _ = part1_bitset()
     print("--- Part 1: ---")
     print(f"The number of times the beam will be split: {password_part1}")
     # Solve Part 2
-    password_part2 = part2()
+    password_part2 = part2_iterative()
     print("\n--- Part 2: ---")
     print(f"Number of different timelines would a single tachyon particle end up on is: {password_part2}")
@@ -1,4 +1,12 @@
-from itertools import combinations
+import heapq
+from itertools import combinations, islice
+
+# Default memory budget (bytes) for one block of the NumPy distance engine
+MEMORY_BUDGET = 64 * 1024 * 1024
+# Approximate working memory per point pair inside a block
+BYTES_PER_PAIR = 48
+# Maximum number of points in one leaf of the KD-tree (PointTree)
+LEAF_SIZE = 8
 
 
 def read_schema():
@@ -31,103 +39,266 @@ def squared_dist(a, b):
     """
     return (a[0] - b[0])**2 + (a[1] - b[1])**2 + (a[2] - b[2])**2
 
-def part1():
+def sorted_edges(points):
+    """
+    Builds every unique pair of points and sorts the pairs by squared distance.
+
+    Returns:
+        list: Tuples (squared_distance, (i, j)) in ascending order of distance.
+    """
+    squared_dists = []
+    for i, j in combinations(range(len(points)), 2):
+        dist = squared_dist(points[i], points[j])
+        squared_dists.append((dist, (i, j)))
+    squared_dists.sort(key=lambda x: x[0])
+    return squared_dists
+
+def shortest_edges_numpy(points, count=None, memory_budget=MEMORY_BUDGET):
+    """
+    Returns only the 'count' shortest edges (default: one per point) in the same
+    (squared_distance, (i, j)) form and order as sorted_edges, using NumPy.
+
+    Logic:
+    1. Splits the upper triangle of the distance matrix into row blocks sized
+       to fit 'memory_budget' bytes.
+    2. Computes the squared distances of one block at a time.
+    3. Merges each block into a running top-'count' selection with a partial
+       partition, keeping ties ordered by (i, j) like the stable sort does.
+    """
+    import numpy as np
+    coords = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    n_points = len(coords)
+    count = n_points if count is None else count
+    if count <= 0:
+        return []
+    rows_per_block = max(1, memory_budget // (BYTES_PER_PAIR * max(n_points, 1)))
+    best_d = np.empty(0, dtype=np.int64)
+    best_i = np.empty(0, dtype=np.int64)
+    best_j = np.empty(0, dtype=np.int64)
+    for start in range(0, n_points - 1, rows_per_block):
+        stop = min(start + rows_per_block, n_points - 1)
+        block = np.zeros((stop - start, n_points - start - 1), dtype=np.int64)
+        for axis in range(3):
+            block += (coords[start:stop, axis, None] - coords[None, start + 1:, axis]) ** 2
+        # Hide the lower triangle (column j <= row i) behind the largest distance
+        width = n_points - start - 1
+        block[np.arange(stop - start)[:, None] > np.arange(width)[None, :]] = np.iinfo(np.int64).max
+        flat = block.ravel()
+        if len(flat) > count:
+            threshold = flat[np.argpartition(flat, count - 1)[count - 1]]
+            flat_indices = np.flatnonzero(flat <= threshold)
+        else:
+            flat_indices = np.arange(len(flat))
+        rows, cols = np.divmod(flat_indices, width)
+        valid = rows <= cols
+        d = np.concatenate((best_d, flat[flat_indices][valid]))
+        i = np.concatenate((best_i, rows[valid] + start))
+        j = np.concatenate((best_j, cols[valid] + start + 1))
+        if len(d) > count:
+            threshold = d[np.argpartition(d, count - 1)[count - 1]]
+            keep = d <= threshold
+            d, i, j = d[keep], i[keep], j[keep]
+            selected = np.lexsort((j, i, d))[:count]
+            d, i, j = d[selected], i[selected], j[selected]
+        best_d, best_i, best_j = d, i, j
+    order = np.lexsort((best_j, best_i, best_d))
+    return [(int(best_d[k]), (int(best_i[k]), int(best_j[k]))) for k in order]
+
+class PointTree:
+    """
+    KD-tree spatial index over 3-D points: every node splits its points at the median
+    of its widest axis, so the cells follow the density of the points (clusters and
+    distant outliers alike). Leaves hold at most LEAF_SIZE points.
+    """
+
+    def __init__(self, points):
+        self.points = points
+        # Per node: bounding box corners, child nodes (None for a leaf) and leaf points
+        self.lows = []
+        self.highs = []
+        self.children = []
+        self.members = []
+        self.root = self.build(list(range(len(points))))
+
+    def build(self, indices):
+        """Adds the subtree over the given point indices and returns its node id."""
+        node = len(self.lows)
+        coords = [[self.points[i][axis] for i in indices] for axis in range(3)]
+        self.lows.append([min(values) for values in coords])
+        self.highs.append([max(values) for values in coords])
+        self.children.append(None)
+        self.members.append(indices)
+        if len(indices) > LEAF_SIZE:
+            axis = max(range(3), key=lambda a: self.highs[node][a] - self.lows[node][a])
+            indices.sort(key=lambda i: self.points[i][axis])
+            middle = len(indices) // 2
+            self.members[node] = ()
+            self.children[node] = (self.build(indices[:middle]), self.build(indices[middle:]))
+        return node
+
+    def box_dist(self, node, point):
+        """Returns the squared distance from the point to the bounding box of a node."""
+        return sum(
+            max(low - c, 0, c - high) ** 2
+            for low, high, c in zip(self.lows[node], self.highs[node], point)
+        )
+
+class NeighborCursor:
+    """
+    Lazily walks the neighbours of one point in increasing distance with a best-first
+    search of the KD-tree. The frontier heap holds tree nodes keyed by the distance to
+    their bounding box and points keyed by their own distance; a point is final once it
+    tops the heap, since every unopened node is at least that far away. Points enter
+    the heap one leaf at a time, so the frontier only grows with the neighbours used.
+    """
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+        # Entries (distance, kind, item): kind 0 for nodes, 1 for points, so on equal
+        # distances nodes are opened first and points keep the (distance, index) order
+        self.frontier = [(0, 0, tree.root)]
+
+    def next(self):
+        """Returns the next (squared_distance, neighbor) pair, or None when exhausted."""
+        tree = self.tree
+        point = tree.points[self.index]
+        while self.frontier:
+            dist, kind, item = heapq.heappop(self.frontier)
+            if kind:
+                return dist, item
+            if tree.children[item] is None:
+                for j in tree.members[item]:
+                    if j != self.index:
+                        heapq.heappush(self.frontier, (squared_dist(point, tree.points[j]), 1, j))
+            else:
+                for child in tree.children[item]:
+                    heapq.heappush(self.frontier, (tree.box_dist(child, point), 0, child))
+        return None
+
+def nearest_edges(points):
+    """
+    Yields the same (squared_distance, (i, j)) edges as sorted_edges, lazily and
+    without materialising all pairs.
+
+    Logic:
+    1. Builds a KD-tree over the points (PointTree).
+    2. Keeps one nearest-neighbour cursor per point in a heap, keyed by the
+       distance of its next neighbour.
+    3. Pops the globally shortest edge, advances that cursor and pushes it back.
+       Every edge is seen from both endpoints, so only the (i < j) copy is yielded.
+    """
+    if len(points) < 2:
+        return
+    tree = PointTree(points)
+    cursors = [NeighborCursor(tree, i) for i in range(len(points))]
+    heap = []
+    for i, cursor in enumerate(cursors):
+        dist, j = cursor.next()
+        heap.append((dist, min(i, j), max(i, j), i))
+    heapq.heapify(heap)
+    while heap:
+        dist, a, b, i = heapq.heappop(heap)
+        if i == a:
+            yield dist, (a, b)
+        following = cursors[i].next()
+        if following is not None:
+            dist, j = following
+            heapq.heappush(heap, (dist, min(i, j), max(i, j), i))
+
+class DisjointSet:
+    """
+    Union-find structure over points 0..n-1 with path compression and union by size.
+    Tracks the size of every component and the current number of components.
+    """
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+
+    def find(self, x):
+        """Returns the root of x's component, compressing the path on the way."""
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, a, b):
+        """
+        Merges the components of a and b (the smaller one goes under the larger one).
+        Returns True if they were separate components before.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def component_sizes(self):
+        """Returns the sizes of all components."""
+        return [self.size[x] for x in range(len(self.parent)) if self.parent[x] == x]
+
+def part1(edge_source=sorted_edges):
     """
     Solves Part 1: Finds the product of the sizes of the 3 largest connected 
     components (circuits) formed by the N shortest connections.
 
     Logic:
     1. Reads the schema points.
-    2. Calculates squared Euclidean distances between all unique pairs of points.
-    3. Sorts the pairs by distance in ascending order.
-    4. Constructs an adjacency list (graph) using only the first N edges 
-       (where N is the number of points).
-    5. Iterates through the points to find connected components using BFS.
-    6. Stores the size of each component found.
-    7. Sorts the component sizes descending and returns the product of the top 3.
+    2. Sorts all unique pairs of points by squared distance (ascending).
+    3. Joins the endpoints of the first N edges (where N is the number
+       of points) in a disjoint-set structure.
+    4. Collects the sizes of the components with at least one connection.
+    5. Sorts the component sizes descending and returns the product of the top 3.
+
+    'edge_source' produces the edges in ascending order (sorted_edges,
+    nearest_edges to consume them lazily from a spatial index, or
+    shortest_edges_numpy to select only the N shortest ones; the latter
+    is meant for Part 1 only).
     """
     points = read_schema()
     n_points = len(points)
-    squared_dists = []
-    for i, j in combinations(range(n_points), 2):
-        dist = squared_dist(points[i], points[j])
-        squared_dists.append((dist, (i, j)))
-    squared_dists.sort(key=lambda x: x[0])
-    adjacency_list = [[] for _ in range(n_points)]
+    circuits = DisjointSet(n_points)
     # Take only as many edges as there are points
-    for _, (i, j) in squared_dists[:n_points]:
-        adjacency_list[i].append(j)
-        adjacency_list[j].append(i)
-    visited = [False] * n_points
-    component_sizes = []
-    for i in range(n_points):
-        if visited[i] or not adjacency_list[i]:
-            continue
-        queue = [i]
-        visited[i] = True
-        current_size = 0
-        while queue:
-            node = queue.pop(0)
-            current_size += 1
-            for neighbor in adjacency_list[node]:
-                if not visited[neighbor]:
-                    visited[neighbor] = True
-                    queue.append(neighbor)
-        component_sizes.append(current_size)
+    for _, (i, j) in islice(edge_source(points), n_points):
+        circuits.union(i, j)
+    component_sizes = [size for size in circuits.component_sizes() if size > 1]
     component_sizes.sort(reverse=True)
     if len(component_sizes) >= 3:
         return component_sizes[0] * component_sizes[1] * component_sizes[2]
     return 0
 
-def check_connectivity(adjacency_list, n_points):
-    """
-    Checks if the graph is fully connected (i.e., every point is reachable 
-    from a starting node).
-    
-    Logic:
-    1. Starts a BFS from node 0.
-    2. Counts the number of unique visited nodes.
-    3. Returns True if the count equals the total number of points.
-    """
-    visited = [False] * n_points
-    queue = [0] 
-    visited[0] = True
-    visit_count = 0
-    while queue:
-        node = queue.pop(0)
-        visit_count += 1
-        for neighbor in adjacency_list[node]:
-            if not visited[neighbor]:
-                visited[neighbor] = True
-                queue.append(neighbor)        
-    return visit_count == n_points
-
-def part2():
+def part2(edge_source=sorted_edges):
     """
     Solves Part 2: Determines when the graph becomes fully connected by 
     incrementally adding edges from shortest to longest.
 
     Logic:
     1. Calculates and sorts all possible edges by distance (ascending).
-    2. Initializes an empty graph (adjacency list).
-    3. Iterates through the sorted edges, adding them one by one.
-    4. After adding an edge, checks if the graph is fully connected.
-    5. If fully connected, returns the product of the X coordinates of the 
-       two points forming the last added edge.
+    2. Starts with every point in its own component (disjoint set).
+    3. Iterates through the sorted edges, joining their endpoints.
+    4. As soon as a single component remains, returns the product of the
+       X coordinates of the two points forming the last added edge.
+
+    'edge_source' produces the edges in ascending order: sorted_edges or
+    nearest_edges. shortest_edges_numpy stops after N edges and is not
+    suitable; a source that runs out before the points are connected raises
+    a ValueError.
     """
     points = read_schema()
-    n_points = len(points)
-    squared_dists = []
-    for i, j in combinations(range(n_points), 2):
-        dist = squared_dist(points[i], points[j])
-        squared_dists.append((dist, (i, j)))
-    squared_dists.sort(key=lambda x: x[0])
-    adjacency_list = [[] for _ in range(n_points)]
-    for _, (i, j) in squared_dists:
-        adjacency_list[i].append(j)
-        adjacency_list[j].append(i)
-        if check_connectivity(adjacency_list, n_points):
+    circuits = DisjointSet(len(points))
+    for _, (i, j) in edge_source(points):
+        if circuits.union(i, j) and circuits.components == 1:
             return points[i][0] * points[j][0]
+    if circuits.components > 1:
+        raise ValueError(f"Edge source ran out with {circuits.components} circuits still separate")
     return 0
 
 if __name__ == "__main__":
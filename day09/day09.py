@@ -1,3 +1,4 @@
+from collections import deque
 from itertools import combinations, pairwise
 
 
@@ -39,6 +40,129 @@ def part2(coords):
     return max_area
 
 
+def staircase(ordered, sy):
+    """
+    Walks points in the given x order and keeps every point that sets a new minimum
+    of sy * y: the monotone staircase chain of the points extreme in that corner
+    (plus, at most, a few harmless extra points sharing an x coordinate).
+    """
+    chain = []
+    best = None
+    for x, y in ordered:
+        if best is None or sy * y < best:
+            chain.append((x, y))
+            best = sy * y
+    return chain
+
+def part1_staircase(coords, block_size=1024):
+    """
+    Finds the maximum area of any rectangle formed by pairs of points, searching only
+    the four staircase chains: the best pair always joins a lower-left point with an
+    upper-right one, or an upper-left point with a lower-right one.
+    Chain pairs are evaluated in NumPy blocks of at most block_size x block_size,
+    since on points in convex position each chain still holds about n / 4 points.
+    """
+    import numpy as np
+    if len(coords) < 2:
+        return 0
+    ordered = sorted(coords)
+    # Areas stay in int64 while the bounding box area fits, Python ints otherwise
+    width = ordered[-1][0] - ordered[0][0] + 1
+    height = max(y for _, y in coords) - min(y for _, y in coords) + 1
+    dtype = np.int64 if width * height <= np.iinfo(np.int64).max else object
+    max_area = 0
+    for sy in (1, -1):
+        chain = np.array(staircase(ordered, sy), dtype=dtype)
+        opposite = np.array(staircase(reversed(ordered), -sy), dtype=dtype)
+        for i in range(0, len(chain), block_size):
+            xs, ys = chain[i:i + block_size, :1], chain[i:i + block_size, 1:]
+            for j in range(0, len(opposite), block_size):
+                us, vs = opposite[j:j + block_size, 0], opposite[j:j + block_size, 1]
+                sizes = (abs(us - xs) + 1) * (abs(vs - ys) + 1)
+                max_area = max(max_area, int(sizes.max()))
+    return max_area
+
+def compress_axis(values):
+    """
+    Maps every distinct coordinate to its own compressed index; a run of tiles between
+    two neighbouring coordinates shares one index. Index 0 and the last index are
+    empty padding. Returns the mapping and the number of compressed indices.
+    """
+    index = {}
+    size = 1
+    previous = None
+    for value in sorted(set(values)):
+        if previous is not None and value - previous > 1:
+            size += 1
+        index[value] = size
+        size += 1
+        previous = value
+    return index, size + 1
+
+def outside_prefix_sums(coords, x_index, y_index, width, height):
+    """
+    Rasterises the polygon onto the compressed grid and returns a 2-D prefix-sum
+    table counting the cells outside it (tiles that are neither red nor green).
+    """
+    boundary = [[False] * width for _ in range(height)]
+    for (x1, y1), (x2, y2) in pairwise(coords + [coords[0]]):
+        cx1, cx2 = sorted((x_index[x1], x_index[x2]))
+        cy1, cy2 = sorted((y_index[y1], y_index[y2]))
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                boundary[cy][cx] = True
+    # Flood fill from the padding: everything reachable without crossing the boundary is outside
+    outside = [[False] * width for _ in range(height)]
+    outside[0][0] = True
+    queue = deque([(0, 0)])
+    while queue:
+        cx, cy = queue.popleft()
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if 0 <= nx < width and 0 <= ny < height and not outside[ny][nx] and not boundary[ny][nx]:
+                outside[ny][nx] = True
+                queue.append((nx, ny))
+    prefix = [[0] * (width + 1) for _ in range(height + 1)]
+    for cy in range(height):
+        row_total = 0
+        for cx in range(width):
+            row_total += outside[cy][cx]
+            prefix[cy + 1][cx + 1] = prefix[cy][cx + 1] + row_total
+    return prefix
+
+def part2_compressed(coords):
+    """
+    Finds the largest area of any rectangle you can make using only red and green tiles,
+    checking each rectangle in O(1) against a prefix-sum table of the compressed grid.
+    Corners are visited in decreasing order of their best possible area, so the search
+    stops as soon as no remaining corner can beat the current maximum.
+    """
+    x_index, width = compress_axis(x for x, _ in coords)
+    y_index, height = compress_axis(y for _, y in coords)
+    prefix = outside_prefix_sums(coords, x_index, y_index, width, height)
+    min_x, max_x = min(x for x, _ in coords), max(x for x, _ in coords)
+    min_y, max_y = min(y for _, y in coords), max(y for _, y in coords)
+
+    def area_bound(corner):
+        x, y = corner
+        return (max(x - min_x, max_x - x) + 1) * (max(y - min_y, max_y - y) + 1)
+
+    max_area = 0
+    for x, y in sorted(coords, key=area_bound, reverse=True):
+        if area_bound((x, y)) <= max_area:
+            break
+        for u, v in coords:
+            size = (abs(u - x) + 1) * (abs(v - y) + 1)
+            if size <= max_area:
+                continue
+            cx1, cx2 = sorted((x_index[x], x_index[u]))
+            cy1, cy2 = sorted((y_index[y], y_index[v]))
+            outside = (prefix[cy2 + 1][cx2 + 1] - prefix[cy1][cx2 + 1]
+                       - prefix[cy2 + 1][cx1] + prefix[cy1][cx1])
+            if outside == 0:
+                max_area = size
+    return max_area
+
+
 if __name__ == "__main__":
     coordinates = read_data()
     # Solve Part 1
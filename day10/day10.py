@@ -1,7 +1,16 @@
+import json
+import os
 import re
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 from itertools import product
-import numpy as np
-from scipy.optimize import milp, LinearConstraint, Bounds
+from math import lcm
+
+# Bump whenever a solver changes its results, so cached answers are discarded
+SOLVER_VERSION = 1
+CACHE_FILE = "day10_cache.json"
 
 
 def read_data(filename="input.txt"):
@@ -74,6 +83,310 @@ def part1(data):
     return total
 
 
+def lights_mask(indices):
+    """Encodes a list of lamp indices as a bitmask (a lamp listed twice cancels out)."""
+    mask = 0
+    for lamp in indices:
+        mask ^= 1 << lamp
+    return mask
+
+
+def min_weight_subset(vectors, goal):
+    """
+    Meet-in-the-middle search: the fewest vectors whose XOR equals goal, or None.
+    Every subset of the first half is tabulated by its XOR; subsets of the second
+    half then look up the XOR they are missing.
+    """
+    half = len(vectors) // 2
+    left = {0: 0}
+    for vector in vectors[:half]:
+        for state, presses in list(left.items()):
+            combined = state ^ vector
+            if presses + 1 < left.get(combined, presses + 2):
+                left[combined] = presses + 1
+    right = {0: 0}
+    for vector in vectors[half:]:
+        for state, presses in list(right.items()):
+            combined = state ^ vector
+            if presses + 1 < right.get(combined, presses + 2):
+                right[combined] = presses + 1
+    best = None
+    for state, presses in right.items():
+        if state ^ goal in left:
+            total = presses + left[state ^ goal]
+            if best is None or total < best:
+                best = total
+    return best
+
+
+def presses_needed_gf2(target, buttons):
+    """
+    Minimum number of presses for one machine, treating it as a linear system over GF(2):
+    buttons and target are bitmasks, and pressing a button twice cancels out.
+
+    Gaussian elimination gives one solution and a basis of the null space; the minimum is
+    searched over all 2^k solutions (Gray-code walk) when the null space dimension k is
+    small, and by meet-in-the-middle over the buttons otherwise. Returns None if the
+    target cannot be reached.
+    """
+    masks = [lights_mask(button) for button in buttons]
+    # pivots: highest lamp bit -> (reduced lamp vector, combination of buttons producing it)
+    pivots = {}
+    null_basis = []
+    for index, vector in enumerate(masks):
+        combo = 1 << index
+        while vector and vector.bit_length() - 1 in pivots:
+            pivot_vector, pivot_combo = pivots[vector.bit_length() - 1]
+            vector ^= pivot_vector
+            combo ^= pivot_combo
+        if vector:
+            pivots[vector.bit_length() - 1] = (vector, combo)
+        else:
+            null_basis.append(combo)
+    goal = lights_mask(i for i, light in enumerate(target) if light)
+    residual = goal
+    solution = 0
+    while residual and residual.bit_length() - 1 in pivots:
+        pivot_vector, pivot_combo = pivots[residual.bit_length() - 1]
+        residual ^= pivot_vector
+        solution ^= pivot_combo
+    if residual:
+        return None
+    if len(null_basis) > len(masks) // 2:
+        return min_weight_subset(masks, goal)
+    best = solution.bit_count()
+    for step in range(1, 1 << len(null_basis)):
+        # Gray code: flip exactly one basis vector per step
+        solution ^= null_basis[(step & -step).bit_length() - 1]
+        best = min(best, solution.bit_count())
+    return best
+
+
+def part1_gf2(data):
+    """
+    Computes the minimum number of presses needed to reach the target lights
+    for all machines with linear algebra over GF(2).
+    """
+    return sum(presses_needed_gf2(target, buttons) for target, buttons in data)
+
+
+def presses_needed_ilp(buttons, jolts):
+    """
+    Solves one machine of Part 2 as an Integer Linear Program with a sparse
+    constraint matrix (one row per counter, one column per button).
+    Raises RuntimeError if the solver does not find an optimum.
+    """
+    import numpy as np
+    from scipy.optimize import milp, LinearConstraint, Bounds
+    from scipy.sparse import coo_array
+    n = len(jolts)
+    m = len(buttons)
+    cells = [(i, j) for j, inds in enumerate(buttons) for i in set(inds)]
+    rows = [i for i, _ in cells]
+    cols = [j for _, j in cells]
+    A = coo_array((np.ones(len(cells)), (rows, cols)), shape=(n, m)).tocsr()
+    c = np.ones(m, dtype=float)
+    jolts_array = np.array(jolts, dtype=float)
+    lc = LinearConstraint(A, lb=jolts_array, ub=jolts_array)
+    bounds = Bounds(lb=np.zeros(m), ub=np.full(m, np.inf))
+    integrality = np.ones(m, dtype=int)
+    res = milp(c=c, constraints=[lc], bounds=bounds, integrality=integrality)
+    if res.status != 0:
+        raise RuntimeError(f"ILP failed with status {res.status}: {res.message}")
+    return int(round(res.fun))
+
+
+def optimal_basis(columns, jolts):
+    """
+    Finds the buttons of an optimal basis of the LP relaxation of one machine
+    (fewest total presses, fractional presses allowed) with a two-phase simplex
+    over the rationals. Bland's rule picks the pivots, so the method cannot cycle.
+    Returns None if the jolts cannot be reached even fractionally.
+    """
+    n, m = len(jolts), len(columns)
+    # Tableau: one column per button, one artificial column per counter, then the jolts
+    rows = [
+        [Fraction(int(i in counters)) for counters in columns]
+        + [Fraction(int(i == k)) for k in range(n)]
+        + [Fraction(jolts[i])]
+        for i in range(n)
+    ]
+    basis = list(range(m, m + n))
+
+    def pivot(r, col):
+        rows[r] = [value / rows[r][col] for value in rows[r]]
+        for k in range(len(rows)):
+            if k != r and rows[k][col] != 0:
+                factor = rows[k][col]
+                rows[k] = [a - factor * b for a, b in zip(rows[k], rows[r])]
+        basis[r] = col
+
+    def minimize(costs, allowed):
+        while True:
+            entering = next((
+                col for col in allowed
+                if costs[col] < sum(costs[b] * row[col] for b, row in zip(basis, rows))
+            ), None)
+            if entering is None:
+                return
+            _, _, r = min(
+                (row[-1] / row[entering], basis[r], r) for r, row in enumerate(rows) if row[entering] > 0
+            )
+            pivot(r, entering)
+
+    # Phase 1: drive the artificial columns to zero
+    minimize([0] * m + [1] * n, range(m + n))
+    if any(row[-1] != 0 for b, row in zip(basis, rows) if b >= m):
+        return None
+    # Pivot the artificial columns left at zero out of the basis; rows without any
+    # button entry are redundant counters and are dropped
+    for r in reversed(range(len(rows))):
+        if basis[r] >= m:
+            col = next((col for col in range(m) if rows[r][col] != 0), None)
+            if col is None:
+                del rows[r], basis[r]
+            else:
+                pivot(r, col)
+    # Phase 2: fewest presses, using button columns only
+    minimize([1] * m + [0] * n, range(m))
+    return basis
+
+
+def presses_needed_exact(buttons, jolts):
+    """
+    Solves one machine of Part 2 exactly with integer arithmetic only.
+
+    Gaussian elimination over the rationals expresses every pivot button through the
+    free buttons, taking as pivots the buttons of an optimal basis of the LP relaxation.
+    A button can be pressed at most as often as the smallest jolt of the counters it
+    feeds, so a branch-and-bound search over the free buttons finds the minimum: at each
+    step the pivot equations narrow the range of the next free button, and only
+    assignments whose pivot presses are non-negative integers are kept.
+    Branches are cut once the LP bound, rounded up, cannot beat the best total found.
+    Raises RuntimeError if the jolts cannot be reached; proving that takes the full
+    search, so unreachable machines are the slowest case.
+    """
+    n = len(jolts)
+    # Identical buttons are interchangeable, so only one copy of each is kept
+    touched = list(dict.fromkeys(tuple(sorted(i for i in set(button) if i < n)) for button in buttons))
+    m = len(touched)
+    upper = [min((jolts[i] for i in counters), default=0) for counters in touched]
+    basis = optimal_basis(touched, jolts)
+    if basis is None:
+        raise RuntimeError("Jolts cannot be reached by any combination of buttons")
+    rows = [[Fraction(int(i in touched[j])) for j in range(m)] + [Fraction(jolts[i])] for i in range(n)]
+    # Reduced row echelon form; the buttons of the optimal LP basis are eliminated first,
+    # so every free button has a non-negative weight in the total and the cost bound
+    # of the search starts from the LP optimum
+    pivot_cols = []
+    for col in sorted(range(m), key=lambda col: (col not in basis, -upper[col])):
+        r = len(pivot_cols)
+        pivot = next((k for k in range(r, n) if rows[k][col] != 0), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        rows[r] = [value / rows[r][col] for value in rows[r]]
+        for k in range(n):
+            if k != r and rows[k][col] != 0:
+                factor = rows[k][col]
+                rows[k] = [a - factor * b for a, b in zip(rows[k], rows[r])]
+        pivot_cols.append(col)
+    if any(row[m] != 0 for row in rows[len(pivot_cols):]):
+        raise RuntimeError("Jolts cannot be reached by any combination of buttons")
+    free_cols = sorted((col for col in range(m) if col not in pivot_cols), key=lambda col: upper[col])
+    # Integer pivot equations: scale * x_pivot = rhs - sum(coefs[f] * x_free[f]),
+    # where 0 <= x_pivot <= upper[pivot], i.e. 0 <= rhs - sum(...) <= limit
+    equations = []
+    for r, pivot_col in enumerate(pivot_cols):
+        scale = lcm(*(value.denominator for value in rows[r]))
+        equations.append((
+            scale,
+            int(rows[r][m] * scale),
+            [int(rows[r][col] * scale) for col in free_cols],
+            scale * upper[pivot_col],
+        ))
+    # The total presses equal base + sum(weights[f] * x_free[f]); both are scaled by a
+    # common denominator to stay in integers
+    weights = [1 - sum(rows[r][col] for r in range(len(pivot_cols))) for col in free_cols]
+    base = sum(rows[r][m] for r in range(len(pivot_cols)))
+    denominator = lcm(base.denominator, *(weight.denominator for weight in weights))
+    weights = [int(weight * denominator) for weight in weights]
+    base = int(base * denominator)
+    free_counters = [touched[col] for col in free_cols]
+    remaining = list(jolts)
+    best = None
+    # Largest total still worth finding: one below the best so far, or a cap of a bounded pass
+    ceiling = None
+
+    def search(k, cost, partial):
+        nonlocal best, ceiling
+        if k == len(free_cols):
+            if not all(
+                (rhs - used) % scale == 0 and 0 <= rhs - used <= pivot_limit
+                for (scale, rhs, _, pivot_limit), used in zip(equations, partial)
+            ):
+                return False
+            total = (base + cost) // denominator
+            if ceiling is None or total <= ceiling:
+                best, ceiling = total, total - 1
+            return True
+        # How often each remaining free button can still be pressed
+        limits = [min((remaining[i] for i in counters), default=0) for counters in free_counters[k:]]
+        optimistic = sum(min(0, weight * limit) for weight, limit in zip(weights[k:], limits))
+        if ceiling is not None and -(-(base + cost + optimistic) // denominator) > ceiling:
+            return
+        # Narrow the range of button k so every pivot can still stay within its bounds,
+        # whatever the later free buttons contribute
+        lowest, highest = 0, limits[0]
+        for (_, rhs, coefs, pivot_limit), used in zip(equations, partial):
+            rest, coef = rhs - used, coefs[k]
+            later = [c * limit for c, limit in zip(coefs[k + 1:], limits[1:])]
+            rest_high = rest - sum(t for t in later if t < 0)
+            rest_low = rest - sum(t for t in later if t > 0) - pivot_limit
+            if coef > 0:
+                lowest = max(lowest, -(-rest_low // coef))
+                highest = min(highest, rest_high // coef)
+            elif coef < 0:
+                lowest = max(lowest, -(rest_high // -coef))
+                highest = min(highest, -rest_low // -coef)
+            elif rest_high < 0 or rest_low > 0:
+                return
+        # Try the presses that lower the total first, to find good solutions early
+        order = range(highest, lowest - 1, -1) if weights[k] < 0 else range(lowest, highest + 1)
+        for value in order:
+            for i in free_counters[k]:
+                remaining[i] -= value
+            solved = search(
+                k + 1,
+                cost + weights[k] * value,
+                [used + eq[2][k] * value for used, eq in zip(partial, equations)],
+            )
+            for i in free_counters[k]:
+                remaining[i] += value
+            # For the last free button, later values only raise the total
+            if solved and k == len(free_cols) - 1:
+                return
+
+    # The LP optimum rounded up is usually the answer, so the first passes only accept
+    # totals up to it (or one more) and prune hard before any solution is known
+    lowest = -(-base // denominator)
+    for ceiling in (lowest, lowest + 1, None):
+        search(0, 0, [0] * len(equations))
+        if best is not None:
+            break
+    if best is None:
+        raise RuntimeError("Jolts cannot be reached by any combination of buttons")
+    return best
+
+
+def part2_exact(data):
+    """
+    Computes the minimum total presses with the exact integer solver,
+    without importing NumPy or SciPy.
+    """
+    return sum(presses_needed_exact(buttons, jolts) for buttons, jolts in data)
+
+
 def part2(data):
     """
     Computes the minimum total presses using Integer Linear Programming (ILP)
@@ -81,24 +394,154 @@ def part2(data):
     """
     total = 0
     for buttons, jolts in data:
-        n = len(jolts)
-        m = len(buttons)
-        A = np.zeros((n, m), dtype=int)
-        for j, inds in enumerate(buttons):
-            for i in inds:
-                A[i, j] = 1
-        c = np.ones(m, dtype=float)
-        jolts_array = np.array(jolts, dtype=float)
-        lc = LinearConstraint(A, lb=jolts_array, ub=jolts_array)
-        bounds = Bounds(lb=np.zeros(m), ub=np.full(m, np.inf))
-        integrality = np.ones(m, dtype=int)
-        res = milp(c=c, constraints=[lc], bounds=bounds, integrality=integrality)
-        if res.status != 0:
-            raise RuntimeError(f"ILP failed with status {res.status}: {res.message}")
-        total += int(round(res.fun))
+        total += presses_needed_ilp(buttons, jolts)
     return total
 
 
+def solve_machines_chunk(chunk):
+    """
+    Worker task for part2_parallel: solves a list of (index, buttons, jolts) machines.
+    Returns (index, presses, error) for each one, so a failing machine does not abort the chunk.
+    """
+    results = []
+    for index, buttons, jolts in chunk:
+        try:
+            results.append((index, presses_needed_ilp(buttons, jolts), None))
+        except Exception as error:
+            results.append((index, None, f"{type(error).__name__}: {error}"))
+    return results
+
+
+def part2_parallel(data, workers=None, chunk_size=64):
+    """
+    Computes the Part 2 minima on a process pool, sending machines to 'workers'
+    processes (default: one per CPU) in chunks of 'chunk_size'.
+
+    Returns:
+        minima (list): Minimum presses of each machine in input order (None if it failed).
+        failures (list): Tuples (machine index, error message) of the failed machines.
+    """
+    machines = [(index, buttons, jolts) for index, (buttons, jolts) in enumerate(data)]
+    chunks = [machines[k:k + chunk_size] for k in range(0, len(machines), chunk_size)]
+    minima = [None] * len(machines)
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(solve_machines_chunk, chunks):
+            for index, presses, error in results:
+                minima[index] = presses
+                if error is not None:
+                    failures.append((index, error))
+    return minima, failures
+
+
+def lights_key(target, buttons):
+    """
+    Canonical cache key of a Part 1 machine: the sorted button bitmasks and the
+    target bitmask, so button order and unused trailing lamps do not matter.
+    """
+    masks = sorted(mask for mask in (lights_mask(button) for button in buttons) if mask)
+    goal = lights_mask(i for i, light in enumerate(target) if light)
+    return f"lights:{','.join(map(str, masks))}|{goal}"
+
+
+def jolts_key(buttons, jolts):
+    """
+    Canonical cache key of a Part 2 machine: the sorted button bitmasks and the jolts,
+    without trailing zero-jolt counters that no button touches.
+    """
+    masks = sorted(mask for mask in (sum(1 << i for i in set(button)) for button in buttons) if mask)
+    used = max(masks, default=0).bit_length()
+    jolts = list(jolts)
+    while len(jolts) > used and jolts[-1] == 0:
+        jolts.pop()
+    return f"jolts:{','.join(map(str, masks))}|{','.join(map(str, jolts))}"
+
+
+class SolutionCache:
+    """
+    LRU cache of machine solutions keyed by canonical machine encodings, persisted
+    as JSON between runs. Entries written by another SOLVER_VERSION are discarded
+    on load, an unreadable or malformed file is treated as empty, and the least
+    recently used entries are evicted above 'max_entries'.
+    Used as a context manager, the cache is saved on exit; otherwise call save().
+    """
+
+    def __init__(self, path=CACHE_FILE, max_entries=100_000, version=SOLVER_VERSION):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    stored = json.load(f)
+                if isinstance(stored, dict) and stored.get("version") == version:
+                    self.entries.update(stored["entries"])
+            except (OSError, ValueError, TypeError, KeyError):
+                self.entries.clear()
+        # The file lists the least recently used entries first
+        while len(self.entries) > max_entries:
+            self.entries.popitem(last=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+    def lookup(self, key, solve):
+        """Returns the cached answer for 'key', calling solve() on a miss."""
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        value = solve()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def save(self):
+        """
+        Writes the cache to disk (least recently used entries first). The data goes to
+        a temporary file in the same directory that then replaces the cache file, so an
+        interrupted write never leaves a truncated cache behind.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": self.version, "entries": list(self.entries.items())}, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def part1_cached(data, cache):
+    """
+    Part 1 with the GF(2) solver, reusing answers of identical machines from 'cache'.
+    New answers reach the disk only when the cache is saved (see SolutionCache).
+    """
+    return sum(
+        cache.lookup(lights_key(target, buttons), lambda: presses_needed_gf2(target, buttons))
+        for target, buttons in data
+    )
+
+
+def part2_cached(data, cache):
+    """
+    Part 2 with the ILP solver, reusing answers of identical machines from 'cache'.
+    New answers reach the disk only when the cache is saved (see SolutionCache).
+    """
+    return sum(
+        cache.lookup(jolts_key(buttons, jolts), lambda: presses_needed_ilp(buttons, jolts))
+        for buttons, jolts in data
+    )
+
+
 if __name__ == "__main__":
     part1_data, part2_data = read_data("input.txt")
     # Solve Part 1
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from collections import deque
 
 
 def read_data(filename="input.txt"):
@@ -15,17 +15,13 @@ def read_data(filename="input.txt"):
         print(f"Error: '{filename}' not found. Ensure the file is present.")
         raise
 
-def part1():
+def build_graph(lines):
     """
-    Counts the number of paths from 'you' to 'out' in a directed graph
-    using depth-first search (DFS) without memoization.
-    
+    Builds the device graph from the input lines.
+
     Returns:
-        result (int): Total number of paths from 'you' to 'out'.
         graph (dict): Graph represented as adjacency lists.
     """
-    lines = read_data()
-    # Build graph
     graph = {}
     for line in lines:
         line = line.strip()
@@ -35,7 +31,19 @@ def part1():
         node = left.strip()
         neighbors = right.strip().split()
         graph[node] = neighbors
-        
+    return graph
+
+def part1(graph=None):
+    """
+    Counts the number of paths from 'you' to 'out' in a directed graph
+    using depth-first search (DFS) without memoization.
+    
+    Returns:
+        result (int): Total number of paths from 'you' to 'out'.
+        graph (dict): Graph represented as adjacency lists.
+    """
+    if graph is None:
+        graph = build_graph(read_data())
     # DFS to count paths
     def count_paths(graph, start, end):
         paths = 0
@@ -53,52 +61,137 @@ def part1():
     return result, graph
 
 
-def part2():
+def part2(graph=None):
     """
-    Counts the number of distinct paths through the graph with multiple segments,
-    using DFS with memoization (lru_cache) for efficiency.
+    Counts the number of distinct paths from 'svr' to 'out' that visit both
+    'fft' and 'dac', using the shared path-count tables of PathCounter.
     
     Returns:
-        result (int): Total number of combined paths from 'svr' to 'out' through specified segments.
+        result (int): Total number of paths from 'svr' to 'out' through 'fft' and 'dac'.
         graph (dict): Graph represented as adjacency lists.
     """
-    lines = read_data()
+    if graph is None:
+        graph = build_graph(read_data())
+    result = PathCounter(graph).count_via("svr", "out", ["fft", "dac"])
+    return result, graph
 
-    # Build graph
-    graph = {}
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        left, right = line.split(":")
-        node = left.strip()
-        neighbors = right.strip().split()
-        graph[node] = neighbors
 
-    # DFS with memoization
-    def count_paths(graph, start, end)
-        @lru_cache(None)
-        def dfs(node):
-            if node == end:
-                return 1
-            return sum(dfs(nxt) for nxt in graph.get(node, []))
+def topological_order(graph):
+    """
+    Sorts all nodes of the graph topologically using Kahn's algorithm.
 
-        return dfs(start)
+    Raises:
+        ValueError: if the graph contains a cycle (path counts would be infinite).
+    """
+    indegree = {}
+    for node, neighbors in graph.items():
+        indegree.setdefault(node, 0)
+        for nxt in neighbors:
+            indegree[nxt] = indegree.get(nxt, 0) + 1
+    queue = deque(node for node, degree in indegree.items() if degree == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for nxt in graph.get(node, []):
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                queue.append(nxt)
+    if len(order) < len(indegree):
+        stuck = sorted(node for node, degree in indegree.items() if degree > 0)
+        raise ValueError(f"Graph contains a cycle; nodes on or behind it: {', '.join(stuck)}")
+    return order
 
-    # Count all segmented paths
-    result = (
-        count_paths(graph, "svr", "fft") * count_paths(graph, "fft", "dac") * count_paths(graph, "dac", "out")
-        + count_paths(graph, "svr", "dac") * count_paths(graph, "dac", "fft") * count_paths(graph, "fft", "out")
-    )
-    return result, graph
+
+def count_paths_to(graph, end, order=None):
+    """
+    Counts the paths from every node to 'end' in one pass over the nodes
+    in reverse topological order.
+
+    Returns:
+        counts (dict): Number of paths from each node to 'end'.
+    """
+    if order is None:
+        order = topological_order(graph)
+    counts = {}
+    for node in reversed(order):
+        if node == end:
+            counts[node] = 1
+        else:
+            counts[node] = sum(counts[nxt] for nxt in graph.get(node, []))
+    return counts
+
+
+def part1_topological(graph=None):
+    """
+    Counts the number of paths from 'you' to 'out' with a topological-order DP
+    instead of enumerating every path.
+
+    Returns:
+        result (int): Total number of paths from 'you' to 'out'.
+        counts (dict): Number of paths to 'out' from every node.
+    """
+    if graph is None:
+        graph = build_graph(read_data())
+    counts = count_paths_to(graph, "out")
+    return counts.get("you", 0), counts
+
+
+class PathCounter:
+    """
+    Answers path-count queries on one DAG. The graph is sorted topologically once,
+    and the table of path counts to each requested target is computed once and
+    shared by all later queries.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.order = topological_order(graph)
+        self.position = {node: index for index, node in enumerate(self.order)}
+        self.tables = {}
+
+    def counts_to(self, target):
+        """Returns the table of path counts from every node to 'target'."""
+        if target not in self.tables:
+            self.tables[target] = count_paths_to(self.graph, target, self.order)
+        return self.tables[target]
+
+    def count(self, source, sink):
+        """Counts the paths from 'source' to 'sink'."""
+        return self.counts_to(sink).get(source, 0)
+
+    def count_via(self, source, sink, waypoints=(), ordered=False):
+        """
+        Counts the paths from 'source' to 'sink' that visit every waypoint.
+        With ordered=True the waypoints must be visited in the given order.
+        Otherwise any order is allowed; in a DAG a path can only visit them in
+        topological order, so that is the only order that has to be counted.
+        """
+        if not ordered:
+            waypoints = sorted(waypoints, key=lambda node: self.position.get(node, -1))
+        stops = [source, *waypoints, sink]
+        result = 1
+        for start, end in zip(stops, stops[1:]):
+            result *= self.count(start, end)
+            if not result:
+                break
+        return result
+
+    def query(self, queries):
+        """
+        Answers a batch of (source, sink, waypoints, ordered) queries,
+        reusing the count tables between them.
+        """
+        return [self.count_via(source, sink, waypoints, ordered) for source, sink, waypoints, ordered in queries]
 
 
 if __name__ == "__main__":
+    device_graph = build_graph(read_data())
     # Solve Part 1
-    result_part1, _ = part1()
+    result_part1, _ = part1(device_graph)
     print("--- Part 1 ---")
     print(f"Number of different paths lead from you to out': {result_part1}")
     # Solve Part 2
-    result_part2, _ = part2()
+    result_part2, _ = part2(device_graph)
     print("\n--- Part 2 ---")
     print(f"Number of those paths visit both dac and fft: {result_part2}")